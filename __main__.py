@@ -5,16 +5,23 @@ Pure declarative Pulumi - AWS-managed add-ons only
 import pulumi
 from src import network, cluster, addons
 
+config = pulumi.Config()
+
 # Exports
-pulumi.export("cluster_name", cluster.cluster_name)
-pulumi.export("cluster_endpoint", cluster.cluster.endpoint)
-pulumi.export("vpc_id", network.vpc.id)
-pulumi.export("subnet_1_id", network.subnet_ids[0])
-pulumi.export("subnet_2_id", network.subnet_ids[1])
-pulumi.export("subnet_3_id", network.subnet_ids[2])
-pulumi.export("kubeconfig_command", 
-    pulumi.Output.concat(
-        "aws eks update-kubeconfig --region af-south-1 --name ",
-        cluster.cluster_name
-    ))
-pulumi.export("add_ons", ["vpc-cni", "coredns", "pod-identity-agent", "ebs-csi-driver", "external-dns", "cert-manager"])
\ No newline at end of file
+outputs = {
+    "cluster_name": cluster.cluster_name,
+    "cluster_endpoint": cluster.cluster.endpoint,
+    "vpc_id": network.vpc.id,
+    "subnet_1_id": network.subnet_ids[0],
+    "subnet_2_id": network.subnet_ids[1],
+    "subnet_3_id": network.subnet_ids[2],
+    "kubeconfig_command": f"aws eks update-kubeconfig --region af-south-1 --name {cluster.cluster_name}",
+    "add_ons": addons.addon_names,
+}
+
+# Single grouped export is opt-in; deploy.sh and the aurora stack read the flat keys
+if config.get_bool("grouped_outputs"):
+    pulumi.export("stack", outputs)
+else:
+    for key, value in outputs.items():
+        pulumi.export(key, value)
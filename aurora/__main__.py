@@ -3,7 +3,7 @@ Aurora PostgreSQL Serverless v2 Stack
 Separate database deployment from EKS cluster
 """
 import pulumi
-from src import database
+import database
 
 # Exports
 pulumi.export("database_endpoint", database.aurora_cluster.endpoint)
@@ -3,6 +3,7 @@ State Storage Bootstrap - Simple Pulumi project for state storage
 Creates S3 bucket and DynamoDB table for Pulumi state backend
 """
 
+import types
 import pulumi
 import pulumi_aws as aws
 
@@ -12,23 +13,29 @@ cluster_name = config.get("cluster_name") or "builder-space"
 aws_region = config.get("aws:region") or "af-south-1"
 
 # Resource names
-bucket_name = f"{cluster_name}-pulumi-state-{aws_region}"
-dynamodb_table_name = f"{cluster_name}-pulumi-state-lock"
+state_prefix = f"{cluster_name}-pulumi-state"
+secrets_prefix = f"{cluster_name}-pulumi-secrets"
+bucket_name = f"{state_prefix}-{aws_region}"
+dynamodb_table_name = f"{state_prefix}-lock"
 
-# Tags
-tags = {
+# Tags (read-only base; per-resource sets below copy it)
+tags = types.MappingProxyType({
     "Project": "builder-space-eks",
     "Environment": "development",
     "ManagedBy": "pulumi",
     "Purpose": "state-storage-bootstrap"
-}
+})
+bucket_tags = {**tags, "Name": state_prefix}
+kms_tags = {**tags, "Name": secrets_prefix}
+lock_table_tags = {**tags, "Name": dynamodb_table_name}
 
 # S3 Bucket with all configurations
 state_bucket = aws.s3.Bucket(
-    f"{cluster_name}-pulumi-state-bucket",
+    f"{state_prefix}-bucket",
     bucket=bucket_name,
 
-    tags={**tags, "Name": f"{cluster_name}-pulumi-state"}
+    tags=bucket_tags,
+    opts=pulumi.ResourceOptions(protect=True)
 )
 
 # S3 configurations
@@ -76,45 +83,54 @@ aws.s3.BucketLifecycleConfiguration(
 
 # KMS Key
 kms_key = aws.kms.Key(
-    f"{cluster_name}-pulumi-secrets-key",
+    f"{secrets_prefix}-key",
     description=f"Pulumi secrets encryption key for {cluster_name}",
     key_usage="ENCRYPT_DECRYPT",
-    tags={**tags, "Name": f"{cluster_name}-pulumi-secrets"}
+    tags=kms_tags,
+    opts=pulumi.ResourceOptions(protect=True)
 )
 
 # KMS Alias
 aws.kms.Alias(
-    f"{cluster_name}-pulumi-secrets-alias",
-    name=f"alias/{cluster_name}-pulumi-secrets",
+    f"{secrets_prefix}-alias",
+    name=f"alias/{secrets_prefix}",
     target_key_id=kms_key.key_id
 )
 
 # DynamoDB Table
 state_lock_table = aws.dynamodb.Table(
-    f"{cluster_name}-pulumi-state-lock-table",
+    f"{dynamodb_table_name}-table",
     name=dynamodb_table_name,
     billing_mode="PAY_PER_REQUEST",
     hash_key="LockID",
     attributes=[aws.dynamodb.TableAttributeArgs(name="LockID", type="S")],
-    tags={**tags, "Name": f"{cluster_name}-pulumi-state-lock"}
+    tags=lock_table_tags,
+    opts=pulumi.ResourceOptions(protect=True)
 )
 
 # Exports
-pulumi.export("bucket_name", state_bucket.id)
-pulumi.export("dynamodb_table_name", state_lock_table.name)
-pulumi.export("kms_key_arn", kms_key.arn)
-pulumi.export("kms_key_id", kms_key.key_id)
-
-pulumi.export("backend_config", {
-    "backend_type": "s3",
-    "bucket": bucket_name,
-    "region": aws_region,
-    "dynamodb_table": dynamodb_table_name,
-    "encrypt": "true"
-})
+outputs = {
+    "bucket_name": state_bucket.id,
+    "dynamodb_table_name": state_lock_table.name,
+    "kms_key_arn": kms_key.arn,
+    "kms_key_id": kms_key.key_id,
+    "backend_config": {
+        "backend_type": "s3",
+        "bucket": bucket_name,
+        "region": aws_region,
+        "dynamodb_table": dynamodb_table_name,
+        "encrypt": "true"
+    },
+    "backend_configuration_commands": [
+        f"export PULUMI_BACKEND_URL=s3://{bucket_name}",
+        f"pulumi config set aws:region {aws_region}",
+        "pulumi up"
+    ],
+}
 
-pulumi.export("backend_configuration_commands", [
-    f"export PULUMI_BACKEND_URL=s3://{bucket_name}",
-    f"pulumi config set aws:region {aws_region}",
-    "pulumi up"
-])
\ No newline at end of file
+# Single grouped export is opt-in, same as the EKS stack
+if config.get_bool("grouped_outputs"):
+    pulumi.export("state_storage", outputs)
+else:
+    for key, value in outputs.items():
+        pulumi.export(key, value)
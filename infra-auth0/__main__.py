@@ -13,7 +13,8 @@ Supports multiple custom domains:
 import json
 import pulumi
 import pulumi_auth0 as auth0
-import pulumi_aws as aws
+
+from _dns import create_auth_cnames
 
 config = pulumi.Config()
 
@@ -64,23 +65,11 @@ all_auth_domains = [f"{auth_subdomain}.{domain}" for domain in all_domains]
 # Internal subdomains
 internal_subdomains = ["k8s.lightsphere.space"]
 
-# All callback URLs (Auth0 supports multiple)
-callback_urls = []
-logout_urls = []
-web_origins = []
-
-# Add callbacks for all auth.* domains
-for domain in all_domains:
-    auth_domain = f"{auth_subdomain}.{domain}"
-    callback_urls.append(f"https://{auth_domain}/oauth2/callback")
-    logout_urls.append(f"https://{auth_domain}")
-    web_origins.append(f"https://{auth_domain}")
-
-# Add callbacks for internal subdomains  
-for subdomain in internal_subdomains:
-    callback_urls.append(f"https://{auth_subdomain}.{subdomain}/oauth2/callback")
-    logout_urls.append(f"https://{auth_subdomain}.{subdomain}")
-    web_origins.append(f"https://{auth_subdomain}.{subdomain}")
+# All callback URLs (Auth0 supports multiple) - auth.* domains, then internal subdomains
+auth_origins = [f"https://{auth_subdomain}.{domain}" for domain in all_domains + internal_subdomains]
+callback_urls = [f"{origin}/oauth2/callback" for origin in auth_origins]
+logout_urls = auth_origins
+web_origins = auth_origins
 
 # ============================================================================
 # Auth0 Application for OAuth2 Proxy
@@ -157,23 +146,17 @@ app = auth0.Client("oauth2-proxy",
 # User Roles and Management
 # ============================================================================
 
-# Admin role for privileged users
-admin_role = auth0.Role("admin-role",
-    name="Administrator",
-    description="Full administrative access to all applications and services",
-)
-
-# Member role for team members
-member_role = auth0.Role("member-role", 
-    name="Team Member",
-    description="Access to internal tools and services",
-)
+# (resource name, role name, description) - admins, team members, external customers
+role_definitions = [
+    ("admin-role", "Administrator", "Full administrative access to all applications and services"),
+    ("member-role", "Team Member", "Access to internal tools and services"),
+    ("customer-role", "Customer", "Access to customer-facing applications"),
+]
 
-# Customer role for external users
-customer_role = auth0.Role("customer-role",
-    name="Customer",
-    description="Access to customer-facing applications",
-)
+roles = {
+    resource_name: auth0.Role(resource_name, name=role_name, description=description)
+    for resource_name, role_name, description in role_definitions
+}
 
 # ============================================================================
 # Custom Domains with Route53 Integration
@@ -187,24 +170,10 @@ customer_role = auth0.Role("customer-role",
 # Create auth.* DNS records for all domains, even if Auth0 limits custom domains
 # ============================================================================
 
-route53_records = {}
-
-# Create DNS records for ALL domains
-for domain in dns_domains:
-    # Get the Route53 hosted zone for this domain
-    zone = aws.route53.get_zone(name=f"{domain}.")
-    
-    # Create CNAME record pointing to Auth0 
-    # All point to the same Auth0 custom domain (sosolola.cloud) for now
-    cname_record = aws.route53.Record(f"auth-cname-{domain.replace('.', '-')}",
-        zone_id=zone.zone_id,
-        name=auth_subdomain,
-        type="CNAME", 
-        ttl=300,
-        records=["tekanya-cd-edaow2ksjrrcfbe8.edge.tenants.eu.auth0.com"],
-    )
-    
-    route53_records[domain] = cname_record
+# Hosted zone IDs are fixed per domain; set zone_ids ({domain: zone_id}) to skip the lookups
+# All point to the same Auth0 custom domain (sosolola.cloud) for now
+route53_records = create_auth_cnames(dns_domains, auth_subdomain, "auth-cname",
+    zone_ids=config.get_object("zone_ids"))
 
 # ============================================================================
 # Auth0 Custom Domain (only ONE allowed on free plan)
@@ -240,10 +209,9 @@ pulumi.export("custom_domain_status", {
 pulumi.export("custom_domain_origins", {
     auth0_custom_domain: custom_domain.origin_domain_name
 })
-pulumi.export("route53_cnames", {
-    domain: route53_records[domain].fqdn
-    for domain in dns_domains
-})
+pulumi.export("route53_cnames", pulumi.Output.all(**{
+    domain: record.fqdn for domain, record in route53_records.items()
+}))
 
 # Export for use in infra-k8s stack
 pulumi.export("oauth2_proxy_config", {
@@ -253,16 +221,14 @@ pulumi.export("oauth2_proxy_config", {
     "custom_domains": all_auth_domains,
 })
 
-# Instructions for next steps
-pulumi.export("next_steps", pulumi.Output.all(
-    client_id=app.client_id,
-    app_id=app.id,
-    domains=all_auth_domains,
-).apply(lambda args: f"""
+# Instructions for next steps - only the client ID is resolved at deploy time
+custom_domain_list = chr(10).join(f"  - https://{d}" for d in all_auth_domains)
+
+pulumi.export("next_steps", app.client_id.apply(lambda client_id: f"""
 Auth0 Configuration Complete!
 
 Custom Domains Configured:
-{chr(10).join(f"  - https://{d}" for d in args['domains'])}
+{custom_domain_list}
 
 Next Steps:
 
@@ -279,14 +245,14 @@ Next Steps:
 3. Update infra-k8s stack configuration:
    cd ../infra-k8s
    pulumi config set auth0_tenant_domain tekanya.eu.auth0.com
-   pulumi config set --secret auth0_client_id {args['client_id']}
+   pulumi config set --secret auth0_client_id {client_id}
    pulumi config set --secret auth0_client_secret <paste_from_step_1>
    pulumi up
 
 4. Update OAuth2 Proxy ArgoCD values:
    Edit: builder-space-argocd/environments/prod/oauth2-proxy/values.yaml
    Set the following values:
-   - Client ID: {args['client_id']}
+   - Client ID: {client_id}
    - Client Secret: <from step 1>
    - Auth0 Domain: tekanya.eu.auth0.com
 
@@ -295,7 +261,7 @@ Next Steps:
    kubectl apply -f applications/infrastructure/oauth2-proxy/application.yaml
 
 6. Test authentication on any domain:
-   Open: https://{args['domains'][0]}
+   Open: https://{all_auth_domains[0]}
    Login with: Your Gmail account
 
 Note: Custom domains require Auth0 Professional plan or higher.
@@ -0,0 +1,30 @@
+"""
+Route53 helpers shared by the Auth0 entry points
+Creates the auth.* CNAME records pointing at the Auth0 edge
+"""
+
+import pulumi_aws as aws
+
+# Auth0 custom domain edge hostname all auth.* records point to
+AUTH0_EDGE_TARGET = "tekanya-cd-edaow2ksjrrcfbe8.edge.tenants.eu.auth0.com"
+
+
+def create_auth_cnames(domains: list[str], subdomain: str, name_prefix: str,
+                       target: str = AUTH0_EDGE_TARGET,
+                       zone_ids: dict[str, str] | None = None) -> dict[str, aws.route53.Record]:
+    """Create a <subdomain>.<domain> CNAME in each domain's hosted zone, keyed by domain.
+
+    Zones listed in zone_ids are used as-is; the rest are looked up in Route53.
+    """
+    zone_ids = zone_ids or {}
+    records = {}
+    for domain in domains:
+        zone_id = zone_ids.get(domain) or aws.route53.get_zone_output(name=f"{domain}.").zone_id
+        records[domain] = aws.route53.Record(f"{name_prefix}-{domain.replace('.', '-')}",
+            zone_id=zone_id,
+            name=subdomain,
+            type="CNAME",
+            ttl=300,
+            records=[target],
+        )
+    return records
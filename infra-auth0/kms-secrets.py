@@ -4,12 +4,16 @@ Creates secrets in AWS KMS and configures External Secrets Operator
 """
 
 import pulumi
+import pulumi.dynamic
 import pulumi_aws as aws
 import pulumi_kubernetes as k8s
 import json
 import base64
+import secrets
 
 config = pulumi.Config()
+current = aws.get_caller_identity_output()
+current_region = aws.get_region_output()
 
 # ============================================================================
 # AWS KMS Key for Auth0 Secrets
@@ -19,6 +23,7 @@ kms_key = aws.kms.Key("auth0-secrets-key",
     description="KMS key for Auth0 OAuth2 Proxy secrets",
     key_usage="ENCRYPT_DECRYPT",
     key_spec="SYMMETRIC_DEFAULT",
+    enable_key_rotation=True,
 )
 
 kms_alias = aws.kms.Alias("auth0-secrets-key-alias",
@@ -33,9 +38,28 @@ kms_alias = aws.kms.Alias("auth0-secrets-key-alias",
 # Auth0 Client Secret (you need to get this from Auth0 dashboard)
 auth0_client_secret = config.get_secret("auth0_client_secret") or "REPLACE_WITH_AUTH0_CLIENT_SECRET"
 
-# Generate cookie secret
-import secrets
-cookie_secret = secrets.token_urlsafe(32)
+# Generate cookie secret once and keep it in state so previews don't rotate it
+class CookieSecretProvider(pulumi.dynamic.ResourceProvider):
+    def create(self, props):
+        return pulumi.dynamic.CreateResult(
+            id_="oauth2-proxy-cookie-secret",
+            outs={"value": secrets.token_urlsafe(32)},
+        )
+
+    def diff(self, _id, _olds, _news):
+        return pulumi.dynamic.DiffResult(changes=False)
+
+
+class CookieSecret(pulumi.dynamic.Resource):
+    value: pulumi.Output[str]
+
+    def __init__(self, name, opts=None):
+        super().__init__(CookieSecretProvider(), name, {"value": None}, opts)
+
+
+cookie_secret = CookieSecret("oauth2-proxy-cookie-secret",
+    opts=pulumi.ResourceOptions(additional_secret_outputs=["value"]),
+).value
 
 # Create secrets in AWS Secrets Manager
 oauth2_secrets = aws.secretsmanager.Secret("oauth2-proxy-secrets",
@@ -46,15 +70,13 @@ oauth2_secrets = aws.secretsmanager.Secret("oauth2-proxy-secrets",
 
 oauth2_secret_version = aws.secretsmanager.SecretVersion("oauth2-proxy-secrets-version",
     secret_id=oauth2_secrets.id,
-    secret_string=pulumi.Output.all(
-        client_id="aPEUWwTH91khPenCjJBEzyZ0wyzV2dZh",
-        client_secret=auth0_client_secret,
-        cookie_secret=cookie_secret
-    ).apply(lambda secrets: json.dumps({
-        "client-id": secrets["client_id"],
-        "client-secret": secrets["client_secret"], 
-        "cookie-secret": secrets["cookie_secret"]
-    }))
+    secret_string=pulumi.Output.all(auth0_client_secret, cookie_secret).apply(
+        lambda args: json.dumps({
+            "client-id": "aPEUWwTH91khPenCjJBEzyZ0wyzV2dZh",
+            "client-secret": args[0],
+            "cookie-secret": args[1]
+        })
+    )
 )
 
 # ============================================================================
@@ -63,22 +85,24 @@ oauth2_secret_version = aws.secretsmanager.SecretVersion("oauth2-proxy-secrets-v
 
 # Create IAM role for External Secrets Operator
 external_secrets_role = aws.iam.Role("external-secrets-role",
-    assume_role_policy=json.dumps({
-        "Version": "2012-10-17",
-        "Statement": [{
-            "Action": "sts:AssumeRoleWithWebIdentity",
-            "Effect": "Allow",
-            "Principal": {
-                "Federated": f"arn:aws:iam::{aws.get_caller_identity().account_id}:oidc-provider/oidc.eks.{aws.get_region().name}.amazonaws.com/id/OIDC_PROVIDER_ID"
-            },
-            "Condition": {
-                "StringEquals": {
-                    f"oidc.eks.{aws.get_region().name}.amazonaws.com/id/OIDC_PROVIDER_ID:sub": "system:serviceaccount:external-secrets:external-secrets",
-                    f"oidc.eks.{aws.get_region().name}.amazonaws.com/id/OIDC_PROVIDER_ID:aud": "sts.amazonaws.com"
+    assume_role_policy=pulumi.Output.all(current.account_id, current_region.name).apply(
+        lambda args: json.dumps({
+            "Version": "2012-10-17",
+            "Statement": [{
+                "Action": "sts:AssumeRoleWithWebIdentity",
+                "Effect": "Allow",
+                "Principal": {
+                    "Federated": f"arn:aws:iam::{args[0]}:oidc-provider/oidc.eks.{args[1]}.amazonaws.com/id/OIDC_PROVIDER_ID"
+                },
+                "Condition": {
+                    "StringEquals": {
+                        f"oidc.eks.{args[1]}.amazonaws.com/id/OIDC_PROVIDER_ID:sub": "system:serviceaccount:external-secrets:external-secrets",
+                        f"oidc.eks.{args[1]}.amazonaws.com/id/OIDC_PROVIDER_ID:aud": "sts.amazonaws.com"
+                    }
                 }
-            }
-        }]
-    })
+            }]
+        })
+    )
 )
 
 # Attach policy to allow reading secrets
@@ -141,7 +165,7 @@ secret_store = k8s.apiextensions.CustomResource("aws-secret-store",
         "provider": {
             "aws": {
                 "service": "SecretsManager",
-                "region": aws.get_region().name,
+                "region": current_region.name,
                 "auth": {
                     "serviceAccount": {
                         "name": "external-secrets"
@@ -170,26 +194,11 @@ external_secret = k8s.apiextensions.CustomResource("oauth2-proxy-external-secret
             "name": "oauth2-proxy",
             "creationPolicy": "Owner"
         },
-        "data": [
-            {
-                "secretKey": "client-id",
-                "remoteRef": {
-                    "key": "oauth2-proxy-auth0",
-                    "property": "client-id"
-                }
-            },
-            {
-                "secretKey": "client-secret", 
-                "remoteRef": {
-                    "key": "oauth2-proxy-auth0",
-                    "property": "client-secret"
-                }
-            },
+        # Fetch the JSON secret once and project its keys (client-id, client-secret, cookie-secret)
+        "dataFrom": [
             {
-                "secretKey": "cookie-secret",
-                "remoteRef": {
-                    "key": "oauth2-proxy-auth0", 
-                    "property": "cookie-secret"
+                "extract": {
+                    "key": "oauth2-proxy-auth0"
                 }
             }
         ]
@@ -224,7 +233,7 @@ Next Steps:
 
 4. Deploy OAuth2 Proxy with secret reference (already configured)
 
-Generated cookie secret (stored in AWS): {cookie_secret}
+Cookie secret: stored in AWS (pulumi stack output --show-secrets cookie_secret_generated)
 KMS Key: {kms_key.key_id}
 Secrets Manager: oauth2-proxy-auth0
 """)
\ No newline at end of file
@@ -6,7 +6,8 @@ Creates DNS records for ALL domains, Auth0 custom domain for primary
 import json
 import pulumi
 import pulumi_auth0 as auth0
-import pulumi_aws as aws
+
+from _dns import AUTH0_EDGE_TARGET, create_auth_cnames
 
 config = pulumi.Config()
 
@@ -31,27 +32,14 @@ AUTH_SUBDOMAIN = "auth"
 # Route53 DNS Records for ALL Domains
 # ============================================================================
 
-route53_records = {}
+# All point to the Auth0 verification domain for now
+route53_records = create_auth_cnames(ALL_DOMAINS, AUTH_SUBDOMAIN, "auth",
+    zone_ids=config.get_object("zone_ids"))
 
 for domain in ALL_DOMAINS:
-    # Get Route53 hosted zone
-    zone = aws.route53.get_zone(name=f"{domain}.")
-    
-    # Create auth.* CNAME record
-    cname_record = aws.route53.Record(f"auth-{domain.replace('.', '-')}",
-        zone_id=zone.zone_id,
-        name=AUTH_SUBDOMAIN,
-        type="CNAME",
-        ttl=300,
-        # All point to the Auth0 verification domain for now
-        records=["tekanya-cd-edaow2ksjrrcfbe8.edge.tenants.eu.auth0.com"],
-    )
-    
-    route53_records[domain] = cname_record
-    
     pulumi.export(f"dns_record_{domain.replace('.', '_')}", {
         "domain": f"auth.{domain}",
-        "target": "tekanya-cd-edaow2ksjrrcfbe8.edge.tenants.eu.auth0.com",
+        "target": AUTH0_EDGE_TARGET,
         "status": "created"
     })
 
@@ -59,24 +47,11 @@ for domain in ALL_DOMAINS:
 # Auth0 Application Configuration
 # ============================================================================
 
-# Build ALL callback URLs
-callback_urls = []
-logout_urls = []
-web_origins = []
-
-# Add auth.* domains
-for domain in ALL_DOMAINS:
-    auth_domain = f"{AUTH_SUBDOMAIN}.{domain}"
-    callback_urls.append(f"https://{auth_domain}/oauth2/callback")
-    logout_urls.append(f"https://{auth_domain}")
-    web_origins.append(f"https://{auth_domain}")
-
-# Add internal subdomains
-for subdomain in INTERNAL_SUBDOMAINS:
-    auth_domain = f"{AUTH_SUBDOMAIN}.{subdomain}"
-    callback_urls.append(f"https://{auth_domain}/oauth2/callback")
-    logout_urls.append(f"https://{auth_domain}")
-    web_origins.append(f"https://{auth_domain}")
+# Build ALL callback URLs - auth.* domains, then internal subdomains
+auth_origins = [f"https://{AUTH_SUBDOMAIN}.{domain}" for domain in ALL_DOMAINS + INTERNAL_SUBDOMAINS]
+callback_urls = [f"{origin}/oauth2/callback" for origin in auth_origins]
+logout_urls = auth_origins
+web_origins = auth_origins
 
 # Auth0 Application
 app = auth0.Client("oauth2-proxy",
@@ -141,7 +116,7 @@ pulumi.export("oauth2_proxy_config", {
 })
 
 pulumi.export("dns_status", {
-    domain: f"auth.{domain} → tekanya-cd-edaow2ksjrrcfbe8.edge.tenants.eu.auth0.com"
+    domain: f"auth.{domain} → {AUTH0_EDGE_TARGET}"
     for domain in ALL_DOMAINS
 })
 
@@ -10,13 +10,16 @@ import json
 config = pulumi.Config()
 cluster_name = config.get("cluster_name") or "builder-space"
 aws_region = config.get("aws:region") or "af-south-1"
+# Scan images on push (default on; set false on dev stacks that push the same image repeatedly)
+scan_on_push = config.get_bool("ecr_scan_on_push") if config.get("ecr_scan_on_push") is not None else True
 
 # Optional Docker Hub credentials for authenticated pulls (higher rate limits)
 dockerhub_username = config.get("dockerhub_username")
 dockerhub_password = config.get_secret("dockerhub_password")
 
-current = aws.get_caller_identity()
+current = aws.get_caller_identity_output()
 account_id = current.account_id
+registry_url = pulumi.Output.concat(account_id, ".dkr.ecr.", aws_region, ".amazonaws.com")
 
 # Tags
 tags = {
@@ -26,6 +29,24 @@ tags = {
     "Purpose": "container-registry"
 }
 
+# Lifecycle policy for private repositories (keep last 10 images), reused by each repo
+lifecycle_policy = json.dumps({
+    "rules": [
+        {
+            "rulePriority": 1,
+            "description": "Keep last 10 images",
+            "selection": {
+                "tagStatus": "any",
+                "countType": "imageCountMoreThan",
+                "countNumber": 10
+            },
+            "action": {
+                "type": "expire"
+            }
+        }
+    ]
+})
+
 # =============================================================================
 # 1. ECR PULL-THROUGH CACHE (Most Cost-Effective)
 # =============================================================================
@@ -89,6 +110,7 @@ k8s_cache = aws.ecr.PullThroughCacheRule("k8s-cache",
 ecr_kms_key = aws.kms.Key("ecr-kms-key",
     description=f"KMS key for {cluster_name} ECR encryption",
     deletion_window_in_days=7,
+    enable_key_rotation=True,
     tags=tags
 )
 
@@ -102,7 +124,7 @@ custom_apps_repo = aws.ecr.Repository("custom-apps",
     name=f"{cluster_name}/custom-apps",
     image_tag_mutability="MUTABLE",
     image_scanning_configuration=aws.ecr.RepositoryImageScanningConfigurationArgs(
-        scan_on_push=True
+        scan_on_push=scan_on_push
     ),
     encryption_configurations=[aws.ecr.RepositoryEncryptionConfigurationArgs(
         encryption_type="KMS",
@@ -114,22 +136,7 @@ custom_apps_repo = aws.ecr.Repository("custom-apps",
 # Lifecycle policy to clean up old images (cost optimization)
 aws.ecr.LifecyclePolicy("custom-apps-lifecycle",
     repository=custom_apps_repo.name,
-    policy=json.dumps({
-        "rules": [
-            {
-                "rulePriority": 1,
-                "description": "Keep last 10 images",
-                "selection": {
-                    "tagStatus": "any",
-                    "countType": "imageCountMoreThan",
-                    "countNumber": 10
-                },
-                "action": {
-                    "type": "expire"
-                }
-            }
-        ]
-    })
+    policy=lifecycle_policy
 )
 
 # =============================================================================
@@ -195,11 +202,11 @@ replication_config = aws.ecr.ReplicationConfiguration("ecr-replication",
 # OUTPUTS
 # =============================================================================
 
-pulumi.export("ecr_registry_url", f"{account_id}.dkr.ecr.{aws_region}.amazonaws.com")
+pulumi.export("ecr_registry_url", registry_url)
 pulumi.export("ecr_registry_id", account_id)
 
 pulumi.export("pull_through_cache_rules", {
-    "k8s": f"{account_id}.dkr.ecr.{aws_region}.amazonaws.com/k8s",
+    "k8s": pulumi.Output.concat(registry_url, "/k8s"),
     "active": "Only K8s registry enabled (no auth required)",
     "disabled": "Docker Hub, Quay, and GHCR require authentication",
     "note": "Uncomment rules in __main__.py after adding credentials via Secrets Manager"
@@ -217,13 +224,14 @@ pulumi.export("cost_estimate", {
     "free_tier": "500MB storage free forever"
 })
 
-pulumi.export("docker_login_command", 
-    f"aws ecr get-login-password --region {aws_region} | docker login --username AWS --password-stdin {account_id}.dkr.ecr.{aws_region}.amazonaws.com"
-)
+pulumi.export("docker_login_command", pulumi.Output.concat(
+    f"aws ecr get-login-password --region {aws_region} | docker login --username AWS --password-stdin ",
+    registry_url
+))
 
 pulumi.export("usage_examples", {
-    "pull_k8s_image": f"docker pull {account_id}.dkr.ecr.{aws_region}.amazonaws.com/k8s/coredns/coredns:latest",
-    "push_custom_image": f"docker push {account_id}.dkr.ecr.{aws_region}.amazonaws.com/{cluster_name}/custom-apps:v1.0.0",
+    "pull_k8s_image": pulumi.Output.concat("docker pull ", registry_url, "/k8s/coredns/coredns:latest"),
+    "push_custom_image": pulumi.Output.concat("docker push ", registry_url, f"/{cluster_name}/custom-apps:v1.0.0"),
     "note": "For Docker Hub images, you'll need to add credentials and enable the pull-through cache rule"
 })
 
@@ -17,7 +17,7 @@ sub_zone = aws.route53.Zone("eks-subdomain",
     }
 )
 
-caller_identity = aws.get_caller_identity()
+caller_identity = aws.get_caller_identity_output()
 
 dnssec_kms_key = None
 ksk = None
@@ -58,7 +58,7 @@ def _derive_oidc_issuer(ci: aws.eks.GetClusterResult):
                 return ident.oidcs[0].issuer
             if hasattr(ident, 'oidc') and hasattr(ident.oidc, 'issuer'):
                 return ident.oidc.issuer
-    except Exception:
+    except (AttributeError, IndexError, TypeError):
         return None
     return None
 
@@ -69,8 +69,8 @@ elif derived_oidc_issuer:
     oidc_issuer = derived_oidc_issuer
 else:
     raise Exception("Unable to determine OIDC issuer automatically. Provide config 'builder-space-k8s:cluster_oidc_issuer'.")
-current = aws.get_caller_identity()
-current_region = aws.get_region()
+oidc_issuer_host = oidc_issuer.replace('https://', '')
+current = aws.get_caller_identity_output()
 
 # ============================================================================
 # OIDC Provider for IRSA (IAM Roles for Service Accounts)
@@ -93,6 +93,26 @@ oidc_provider = aws.iam.OpenIdConnectProvider("eks-oidc-provider",
 
 # Update the oidc_provider_arn to use the created provider
 oidc_provider_arn = oidc_provider.arn
+
+def _irsa_assume_role_policy(namespace: str, service_account: str):
+    """Trust policy letting a Kubernetes service account assume the role via the OIDC provider"""
+    return oidc_provider_arn.apply(lambda provider_arn: json.dumps({
+        "Version": "2012-10-17",
+        "Statement": [{
+            "Effect": "Allow",
+            "Principal": {
+                "Federated": provider_arn
+            },
+            "Action": "sts:AssumeRoleWithWebIdentity",
+            "Condition": {
+                "StringEquals": {
+                    f"{oidc_issuer_host}:sub": f"system:serviceaccount:{namespace}:{service_account}",
+                    f"{oidc_issuer_host}:aud": "sts.amazonaws.com"
+                }
+            }
+        }]
+    }))
+
 # ============================================================================
 
 # Simple k8s provider
@@ -100,24 +120,7 @@ k8s_provider = k8s.Provider("k8s-provider")
 
 # IAM Role for External DNS
 external_dns_role = aws.iam.Role("external-dns-role",
-    assume_role_policy=pulumi.Output.all(oidc_provider_arn, oidc_issuer).apply(
-        lambda args: json.dumps({
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Principal": {
-                    "Federated": args[0]  # oidc_provider_arn
-                },
-                "Action": "sts:AssumeRoleWithWebIdentity",
-                "Condition": {
-                    "StringEquals": {
-                        f"{args[1].replace('https://', '')}:sub": "system:serviceaccount:external-dns:external-dns",
-                        f"{args[1].replace('https://', '')}:aud": "sts.amazonaws.com"
-                    }
-                }
-            }]
-        })
-    )
+    assume_role_policy=_irsa_assume_role_policy("external-dns", "external-dns")
 )
 
 aws.iam.RolePolicy("external-dns-policy",
@@ -138,24 +141,7 @@ aws.iam.RolePolicy("external-dns-policy",
 
 # IAM Role for Cluster Autoscaler
 cluster_autoscaler_role = aws.iam.Role("cluster-autoscaler-role",
-    assume_role_policy=pulumi.Output.all(oidc_provider_arn, oidc_issuer).apply(
-        lambda args: json.dumps({
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Principal": {
-                    "Federated": args[0]  # oidc_provider_arn
-                },
-                "Action": "sts:AssumeRoleWithWebIdentity",
-                "Condition": {
-                    "StringEquals": {
-                        f"{args[1].replace('https://', '')}:sub": "system:serviceaccount:kube-system:cluster-autoscaler",
-                        f"{args[1].replace('https://', '')}:aud": "sts.amazonaws.com"
-                    }
-                }
-            }]
-        })
-    )
+    assume_role_policy=_irsa_assume_role_policy("kube-system", "cluster-autoscaler")
 )
 
 aws.iam.RolePolicy("cluster-autoscaler-policy",
@@ -184,24 +170,7 @@ aws.iam.RolePolicy("cluster-autoscaler-policy",
 
 # IAM Role for EBS CSI Driver
 ebs_csi_role = aws.iam.Role("ebs-csi-driver-role",
-    assume_role_policy=pulumi.Output.all(oidc_provider_arn, oidc_issuer).apply(
-        lambda args: json.dumps({
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Principal": {
-                    "Federated": args[0]  # oidc_provider_arn
-                },
-                "Action": "sts:AssumeRoleWithWebIdentity",
-                "Condition": {
-                    "StringEquals": {
-                        f"{args[1].replace('https://', '')}:sub": "system:serviceaccount:kube-system:ebs-csi-controller-sa",
-                        f"{args[1].replace('https://', '')}:aud": "sts.amazonaws.com"
-                    }
-                }
-            }]
-        })
-    )
+    assume_role_policy=_irsa_assume_role_policy("kube-system", "ebs-csi-controller-sa")
 )
 
 # Attach AWS managed policy for EBS CSI Driver
@@ -228,30 +197,13 @@ ebs_csi_addon = aws.eks.Addon("ebs-csi-driver",
 
 # IAM Role for External Secrets Operator
 external_secrets_role = aws.iam.Role("external-secrets-operator-role",
-    assume_role_policy=pulumi.Output.all(oidc_provider_arn, oidc_issuer).apply(
-        lambda args: json.dumps({
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Principal": {
-                    "Federated": args[0]  # oidc_provider_arn
-                },
-                "Action": "sts:AssumeRoleWithWebIdentity",
-                "Condition": {
-                    "StringEquals": {
-                        f"{args[1].replace('https://', '')}:sub": "system:serviceaccount:external-secrets:external-secrets",
-                        f"{args[1].replace('https://', '')}:aud": "sts.amazonaws.com"
-                    }
-                }
-            }]
-        })
-    )
+    assume_role_policy=_irsa_assume_role_policy("external-secrets", "external-secrets")
 )
 
 # IAM Policy for External Secrets Operator to access Secrets Manager
 external_secrets_policy = aws.iam.RolePolicy("external-secrets-policy",
     role=external_secrets_role.id,
-    policy=json.dumps({
+    policy=current.account_id.apply(lambda account_id: json.dumps({
         "Version": "2012-10-17",
         "Statement": [{
             "Effect": "Allow",
@@ -260,10 +212,10 @@ external_secrets_policy = aws.iam.RolePolicy("external-secrets-policy",
                 "secretsmanager:DescribeSecret"
             ],
             "Resource": [
-                f"arn:aws:secretsmanager:{aws_region}:{current.account_id}:secret:oauth2-proxy-auth0-*"
+                f"arn:aws:secretsmanager:{aws_region}:{account_id}:secret:oauth2-proxy-auth0-*"
             ]
         }]
-    })
+    }))
 )
 
 # ============================================================================
@@ -52,3 +52,6 @@ cert_manager = aws.eks.Addon("cert-manager",
     addon_version="v1.14.4-eksbuild.1",
     resolve_conflicts_on_create="OVERWRITE",
     resolve_conflicts_on_update="OVERWRITE")
+
+# Exports for use in other modules
+addon_names = ["vpc-cni", "coredns", "pod-identity-agent", "ebs-csi-driver", "external-dns", "cert-manager"]
@@ -14,16 +14,20 @@ github_role_arn = config.get("github_actions_role_arn")
 node_count = int(config.get("node_count") or "3")
 instance_type = config.get("instance_type") or "t3.xlarge"
 
-# IAM role for cluster
-cluster_role = aws.iam.Role("eks-cluster-role",
-    assume_role_policy=json.dumps({
+# Trust policy for AWS service principals
+def _assume_role_policy(service: str) -> str:
+    return json.dumps({
         "Version": "2012-10-17",
         "Statement": [{
             "Action": "sts:AssumeRole",
             "Effect": "Allow",
-            "Principal": {"Service": "eks.amazonaws.com"}
+            "Principal": {"Service": service}
         }]
-    }))
+    })
+
+# IAM role for cluster
+cluster_role = aws.iam.Role("eks-cluster-role",
+    assume_role_policy=_assume_role_policy("eks.amazonaws.com"))
 
 aws.iam.RolePolicyAttachment("eks-cluster-policy",
     policy_arn="arn:aws:iam::aws:policy/AmazonEKSClusterPolicy",
@@ -31,31 +35,18 @@ aws.iam.RolePolicyAttachment("eks-cluster-policy",
 
 # IAM role for nodes
 node_role = aws.iam.Role("eks-node-role",
-    assume_role_policy=json.dumps({
-        "Version": "2012-10-17",
-        "Statement": [{
-            "Action": "sts:AssumeRole",
-            "Effect": "Allow",
-            "Principal": {"Service": "ec2.amazonaws.com"}
-        }]
-    }))
+    assume_role_policy=_assume_role_policy("ec2.amazonaws.com"))
 
 # Attach required node policies
-aws.iam.RolePolicyAttachment("node-policy-worker",
-    policy_arn="arn:aws:iam::aws:policy/AmazonEKSWorkerNodePolicy",
-    role=node_role.name)
-
-aws.iam.RolePolicyAttachment("node-policy-cni",
-    policy_arn="arn:aws:iam::aws:policy/AmazonEKS_CNI_Policy",
-    role=node_role.name)
-
-aws.iam.RolePolicyAttachment("node-policy-ecr",
-    policy_arn="arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly",
-    role=node_role.name)
-
-aws.iam.RolePolicyAttachment("node-policy-ssm",
-    policy_arn="arn:aws:iam::aws:policy/AmazonSSMManagedInstanceCore",
-    role=node_role.name)
+for name, policy_arn in [
+    ("node-policy-worker", "arn:aws:iam::aws:policy/AmazonEKSWorkerNodePolicy"),
+    ("node-policy-cni", "arn:aws:iam::aws:policy/AmazonEKS_CNI_Policy"),
+    ("node-policy-ecr", "arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly"),
+    ("node-policy-ssm", "arn:aws:iam::aws:policy/AmazonSSMManagedInstanceCore"),
+]:
+    aws.iam.RolePolicyAttachment(name,
+        policy_arn=policy_arn,
+        role=node_role.name)
 
 # EKS Cluster
 cluster = aws.eks.Cluster("cluster",
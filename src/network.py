@@ -56,17 +56,10 @@ route_table = aws.ec2.RouteTable("public-rt",
     tags={"Name": "lightsphere-public-rt"})
 
 # Associate all subnets with route table
-aws.ec2.RouteTableAssociation("subnet1-rt",
-    subnet_id=subnet1.id, 
-    route_table_id=route_table.id)
-
-aws.ec2.RouteTableAssociation("subnet2-rt",
-    subnet_id=subnet2.id, 
-    route_table_id=route_table.id)
-
-aws.ec2.RouteTableAssociation("subnet3-rt",
-    subnet_id=subnet3.id, 
-    route_table_id=route_table.id)
+for i, subnet in enumerate([subnet1, subnet2, subnet3], 1):
+    aws.ec2.RouteTableAssociation(f"subnet{i}-rt",
+        subnet_id=subnet.id,
+        route_table_id=route_table.id)
 
 # Exports for use in other modules
 subnet_ids = [subnet1.id, subnet2.id, subnet3.id]